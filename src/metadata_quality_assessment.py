@@ -24,12 +24,24 @@ The module provides functions to:
 - Determine an overall quality rating
 """
 
-from typing import Dict, Any, List, Callable, Tuple, Optional
+from typing import Dict, Any, List, Callable, Tuple, Optional, Iterable, Iterator, NamedTuple, Union, TextIO
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from bisect import bisect_right
+from itertools import islice
+import multiprocessing
+import threading
+import json
 import re
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
 import pandas as pd
-import json
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import orjson
 import os
 
 # ------------------------------------------------
@@ -67,25 +79,37 @@ BERLIN_TO_DCAT_FIELD_MAPPING = {
     "date_updated": "dct:modified"
 }
 
+# Columns read by the indicators and the results; other columns can be
+# skipped when loading metadata from a file
+SCORING_COLUMNS = [
+    "id", "title", "organization", "organization.title",
+    "tags", "groups", "geographical_coverage", "temporal_coverage_from", "temporal_coverage_to",
+    "url", "resources", "license_id", "license_title",
+    "maintainer", "maintainer_email", "author", "date_released", "date_updated"
+]
+
+# Columns with few distinct values, loaded as categoricals to save memory
+CATEGORICAL_COLUMNS = ["license_id", "license_title", "author", "maintainer"]
+
 # Define the accepted MIME types from data.europa.eu and DCAT-AP.de
-ACCEPTED_MIME_TYPES = [
+ACCEPTED_MIME_TYPES = frozenset({
     "text/csv", "application/json", "application/xml", 
     "application/geopackage+sqlite3", "application/gml+xml",
     "application/vnd.ms-excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     "application/zip", "application/pdf", "application/wfs", "application/wms"
-]
+})
 
 # Non-proprietary formats
-NON_PROPRIETARY_FORMATS = [
+NON_PROPRIETARY_FORMATS = frozenset({
     "csv", "json", "xml", "gml", "geojson", "gpkg", "txt", "markdown", "md",
     "html", "htm", "zip", "rdf", "nt", "ttl", "n3", "jsonld", "trig", "wfs", "wms"
-]
+})
 
 # Machine-readable formats
-MACHINE_READABLE_FORMATS = [
+MACHINE_READABLE_FORMATS = frozenset({
     "csv", "json", "xml", "rdf", "nt", "ttl", "n3", "jsonld", "trig",
     "geojson", "gpkg", "gml", "xlsx", "xls", "ods", "wfs"
-]
+})
 
 # Valid DCAT-AP.de license IDs
 VALID_DCAT_AP_DE_LICENSES = [
@@ -95,12 +119,38 @@ VALID_DCAT_AP_DE_LICENSES = [
     "other-closed"
 ]
 
-# Values that indicate hidden nulls
-HIDDEN_NULLS = (
+# Lowercased lookup sets for case-insensitive vocabulary checks
+VALID_LICENSES_LOWER = frozenset(lic.lower() for lic in VALID_DCAT_AP_DE_LICENSES)
+ACCEPTED_MIME_TYPES_LOWER = frozenset(mime.lower() for mime in ACCEPTED_MIME_TYPES)
+
+# Values that indicate hidden nulls (lowercase, compared against lowercased values)
+HIDDEN_NULLS = frozenset({
     "", "null", "[]", "{}", "nan", "none", "ohne angabe", 
-    "keine angabe", "nichts", "N/A", "n/a"
+    "keine angabe", "nichts", "n/a"
+})
+
+# Longer strings can never be hidden nulls, so they don't need to be lowercased
+HIDDEN_NULLS_MAX_LENGTH = max(len(value) for value in HIDDEN_NULLS)
+
+# Common formats used in Berlin's data portal
+COMMON_FORMATS = (
+    "csv", "json", "xml", "wfs", "wms", "pdf", "zip", "xls", "xlsx", 
+    "html", "geojson", "gml", "kml", "shp", "gpkg", "gis"
 )
 
+# Single-pass lookups for check_format_in_register: all accepted MIME types
+# joined into one string, and one regular expression for all common formats
+MIME_TYPE_SEPARATOR = "\n"
+ACCEPTED_MIME_TYPES_TEXT = MIME_TYPE_SEPARATOR.join(sorted(ACCEPTED_MIME_TYPES_LOWER))
+COMMON_FORMATS_PATTERN = re.compile("|".join(re.escape(fmt) for fmt in COMMON_FORMATS))
+
+# Number of datasets scored at once when processing datasets in batches
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Settings for URL accessibility checks
+URL_CHECK_TIMEOUT = 5
+URL_CHECK_MAX_WORKERS = 32
+
 # Define maximum points per dimension
 MAX_POINTS_PER_DIMENSION = {
     "Findability": 100,
@@ -110,6 +160,26 @@ MAX_POINTS_PER_DIMENSION = {
     "Context": 20
 }
 
+# Lower score bounds of the rating categories above "Mangelhaft" (Poor)
+RATING_BINS = (121, 221, 351)
+RATING_LABELS = ("Mangelhaft", "Ausreichend", "Gut", "Ausgezeichnet")
+RATING_LABELS_ARRAY = np.array(RATING_LABELS, dtype=object)
+
+# Shared HTTP session so that URL checks reuse pooled connections
+# instead of opening a new TCP/TLS connection per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=Retry(total=0)))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=Retry(total=0)))
+
+# Thread pool for checking the URLs of a single dataset concurrently,
+# created on first use (see _get_url_check_executor)
+_url_check_executor: Optional[ThreadPoolExecutor] = None
+_url_check_executor_lock = threading.Lock()
+
+# Accessibility of every URL checked so far, including results made
+# in another process (see preload_url_status)
+_URL_STATUS: Dict[str, bool] = {}
+
 # ------------------------------------------------
 # Helper Functions
 # ------------------------------------------------
@@ -118,25 +188,20 @@ def clamp_score(value: int, max_points: int) -> int:
     """Clamp a score between 0 and max_points."""
     return max(0, min(value, max_points))
 
-def check_presence(metadata: Dict[str, Any], field_name: str) -> bool:
+def is_present_value(value: Any) -> bool:
     """
-    Returns True if 'field_name' is present in 'metadata' and not empty.
+    Returns True if 'value' is not empty.
     Handles various forms of "empty" values.
     """
-    if field_name not in metadata:
-        return False
-    
-    value = metadata[field_name]
-    
     # Handle None
     if value is None:
         return False
         
     # Handle empty strings and hidden nulls
     if isinstance(value, str):
-        if value.lower() in HIDDEN_NULLS or value.strip() == "":
+        if not value or value.isspace():
             return False
-        return True
+        return len(value) > HIDDEN_NULLS_MAX_LENGTH or value.lower() not in HIDDEN_NULLS
         
     # Handle lists
     if isinstance(value, list):
@@ -153,14 +218,125 @@ def check_presence(metadata: Dict[str, Any], field_name: str) -> bool:
     # Default case for other types
     return True
 
+def check_presence(metadata: Dict[str, Any], field_name: str) -> bool:
+    """
+    Returns True if 'field_name' is present in 'metadata' and not empty.
+    Handles various forms of "empty" values.
+    """
+    if field_name not in metadata:
+        return False
+    
+    return is_present_value(metadata[field_name])
+
+def is_non_empty_list(value: Any) -> bool:
+    """Returns True if 'value' is a list with at least one non-empty item."""
+    return isinstance(value, list) and is_present_value(value)
+
+def is_resource_list(value: Any) -> bool:
+    """Returns True if 'value' is a non-empty list of resources (distributions)."""
+    return isinstance(value, list) and len(value) > 0
+
+def has_distributions(metadata: Dict[str, Any]) -> bool:
+    """Returns True if the dataset has a non-empty list of resources (distributions)."""
+    return is_resource_list(metadata.get("resources"))
+
 def is_url_accessible(url: str) -> bool:
-    """Check if a URL is accessible (returns 2xx or 3xx status code)."""
+    """
+    Check if a URL is accessible (returns 2xx or 3xx status code).
+    Results are cached, so each distinct URL is only requested once per run.
+    Values that are not strings (e.g. a list of URLs) are not accessible.
+    """
+    if not isinstance(url, str):
+        return False
+        
+    status = _URL_STATUS.get(url)
+    if status is None:
+        status = _URL_STATUS[url] = _check_url(url)
+    return status
+
+def _check_url(url: str) -> bool:
+    """Request a URL and return whether it is accessible, see is_url_accessible."""
     try:
-        response = requests.head(url, timeout=5)
+        response = _SESSION.head(url, timeout=URL_CHECK_TIMEOUT)
         return response.status_code < 400
-    except:
+    except Exception:
         return False
 
+def preload_url_status(url_status: Dict[str, bool]) -> None:
+    """
+    Make URL check results from another process available to is_url_accessible.
+    
+    Meant as a process pool initializer, so that worker processes reuse the
+    checks made by the parent instead of requesting the URLs again.
+    
+    Args:
+        url_status: Mapping of URL to accessibility, e.g. from check_urls_accessible
+    """
+    _URL_STATUS.update(url_status)
+
+def check_urls_accessible(urls: Iterable[str], 
+                          max_workers: int = URL_CHECK_MAX_WORKERS,
+                          show_progress: bool = False) -> Dict[str, bool]:
+    """
+    Check a batch of URLs concurrently.
+    
+    Duplicate URLs are only checked once. The results are also stored in the
+    cache of is_url_accessible, so later calls for the same URLs are lookups.
+    
+    Args:
+        urls: URLs to check
+        max_workers: Number of concurrent requests
+        show_progress: Whether to show a progress bar
+        
+    Returns:
+        Dictionary mapping each URL to its accessibility
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+        
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(is_url_accessible, unique_urls)
+        if show_progress:
+            results = tqdm(results, total=len(unique_urls), desc="Checking URLs", 
+                           mininterval=0.5, miniters=max(1, len(unique_urls) // 200))
+        return dict(zip(unique_urls, results))
+
+def _get_url_check_executor() -> ThreadPoolExecutor:
+    """Return the thread pool of any_url_accessible, creating it on first use rather than at import."""
+    global _url_check_executor
+    
+    with _url_check_executor_lock:
+        if _url_check_executor is None:
+            _url_check_executor = ThreadPoolExecutor(max_workers=URL_CHECK_MAX_WORKERS)
+    return _url_check_executor
+
+def any_url_accessible(urls: List[str]) -> bool:
+    """
+    Check if any of the URLs is accessible.
+    
+    URLs checked before (e.g. by check_urls_accessible) are looked up first.
+    The remaining URLs are requested concurrently and the check returns as soon
+    as one of them is accessible, cancelling the requests not yet started.
+    """
+    unchecked_urls = []
+    for url in dict.fromkeys(urls):
+        status = _URL_STATUS.get(url)
+        if status:
+            return True
+        if status is None:
+            unchecked_urls.append(url)
+            
+    if len(unchecked_urls) <= 1:
+        return any(is_url_accessible(url) for url in unchecked_urls)
+        
+    futures = [_get_url_check_executor().submit(is_url_accessible, url) for url in unchecked_urls]
+    try:
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        for future in futures:
+            future.cancel()
+
 def check_format_in_register(format_value: str) -> bool:
     """
     Check if the format is in a recognized format register
@@ -171,90 +347,194 @@ def check_format_in_register(format_value: str) -> bool:
         
     format_lower = format_value.lower()
     
-    # Check against MIME types
-    for mime in ACCEPTED_MIME_TYPES:
-        if format_lower in mime.lower():
-            return True
-    
-    # Check common formats used in Berlin's data portal
-    common_formats = [
-        "csv", "json", "xml", "wfs", "wms", "pdf", "zip", "xls", "xlsx", 
-        "html", "geojson", "gml", "kml", "shp", "gpkg", "gis"
-    ]
-    
-    # Check if the format is one of the common formats
-    if format_lower in common_formats:
+    # Check against MIME types (e.g., "csv" or "excel" appear in a MIME type)
+    if MIME_TYPE_SEPARATOR not in format_lower and format_lower in ACCEPTED_MIME_TYPES_TEXT:
         return True
+    
+    # Check if the format is or contains one of the common formats (e.g., "CSV-Datei")
+    return COMMON_FORMATS_PATTERN.search(format_lower) is not None
+
+def normalize_resource_value(resource: Dict[str, Any], key: str) -> Optional[str]:
+    """Return the lowercased value of 'key' in a resource, or None if it is empty."""
+    value = resource.get(key, "")
+    if not isinstance(value, str) or not value or value.isspace():
+        return None
         
-    # Check if format contains one of the common formats (e.g., "EXCEL", "CSV-Datei")
-    for fmt in common_formats:
-        if fmt in format_lower:
-            return True
+    value = value.lower()
+    return None if value in HIDDEN_NULLS else value
+
+class ResourceFeatures(NamedTuple):
+    """
+    Values of a dataset's resources that the indicators need, collected in one pass.
+    Values are only collected from non-empty resources, so any value found
+    implies that check_presence(metadata, "resources") is True.
+    """
+    formats: List[str]
+    mimetypes: List[str]
+    urls: List[str]
+    has_size: bool
+    has_vocab_format: bool
+    has_vocab_mimetype: bool
+    has_non_proprietary: bool
+    has_machine_readable: bool
+
+def parse_resources(resources: Any) -> ResourceFeatures:
+    """
+    Walk a list of resources once and collect their formats, media types,
+    URLs and sizes, along with the vocabulary checks on formats and media types.
+    """
+    formats = []
+    mimetypes = []
+    urls = []
+    has_size = has_vocab_format = has_vocab_mimetype = False
+    has_non_proprietary = has_machine_readable = False
     
-    return False
+    if isinstance(resources, list):
+        for resource in resources:
+            if not isinstance(resource, dict):
+                continue
+                
+            fmt = normalize_resource_value(resource, "format")
+            if fmt is not None:
+                formats.append(fmt)
+                has_vocab_format = has_vocab_format or check_format_in_register(fmt)
+                has_non_proprietary = has_non_proprietary or fmt in NON_PROPRIETARY_FORMATS
+                has_machine_readable = has_machine_readable or fmt in MACHINE_READABLE_FORMATS
+                
+            mimetype = normalize_resource_value(resource, "mimetype")
+            if mimetype is not None:
+                mimetypes.append(mimetype)
+                has_vocab_mimetype = has_vocab_mimetype or mimetype in ACCEPTED_MIME_TYPES_LOWER
+                
+            url = normalize_resource_value(resource, "url")
+            if url is not None:
+                urls.append(url)
+                
+            has_size = has_size or check_presence(resource, "size")
+            
+    return ResourceFeatures(formats, mimetypes, urls, has_size, has_vocab_format, 
+                            has_vocab_mimetype, has_non_proprietary, has_machine_readable)
+
+# Resources list parsed by the calculate_* call running in this thread and
+# its features, so the indicators of one dataset parse the resources only
+# once. Thread-local, so concurrent calls do not see each other's dataset.
+_scoring_state = threading.local()
+
+@contextmanager
+def _parse_resources_once(metadata: Dict[str, Any]) -> Iterator[None]:
+    """Share the parsed resources of a dataset between its indicators while scoring it."""
+    resources = metadata.get("resources")
+    previous = getattr(_scoring_state, "resources", (None, None))
+    _scoring_state.resources = (resources, parse_resources(resources))
+    try:
+        yield
+    finally:
+        _scoring_state.resources = previous
+
+def get_resource_features(metadata: Dict[str, Any]) -> ResourceFeatures:
+    """
+    Return the ResourceFeatures of a dataset. While the dataset is scored by
+    calculate_mqa_score or calculate_dimension_scores, the resources parsed
+    at the start of the call are reused; otherwise they are parsed again.
+    """
+    resources = metadata.get("resources")
+    parsed_resources, features = getattr(_scoring_state, "resources", (None, None))
+    if features is None or parsed_resources is not resources:
+        features = parse_resources(resources)
+        
+    return features
 
 def extract_resources_formats(metadata: Dict[str, Any]) -> List[str]:
     """Extract all format values from resources."""
-    formats = []
-    
-    if "resources" in metadata and isinstance(metadata["resources"], list):
-        for resource in metadata["resources"]:
-            if isinstance(resource, dict) and "format" in resource:
-                format_value = resource.get("format", "")
-                if format_value and format_value.strip() and format_value.lower() not in HIDDEN_NULLS:
-                    formats.append(format_value.lower())
-                    
-    return formats
+    return parse_resources(metadata.get("resources")).formats
 
 def extract_resources_mimetypes(metadata: Dict[str, Any]) -> List[str]:
     """Extract all mimetype values from resources."""
-    mimetypes = []
-    
-    if "resources" in metadata and isinstance(metadata["resources"], list):
-        for resource in metadata["resources"]:
-            if isinstance(resource, dict) and "mimetype" in resource:
-                mimetype = resource.get("mimetype", "")
-                if mimetype and mimetype.strip() and mimetype.lower() not in HIDDEN_NULLS:
-                    mimetypes.append(mimetype.lower())
-                    
-    return mimetypes
+    return parse_resources(metadata.get("resources")).mimetypes
 
 def extract_resources_urls(metadata: Dict[str, Any]) -> List[str]:
     """Extract all URL values from resources."""
-    urls = []
+    return parse_resources(metadata.get("resources")).urls
+
+def collect_urls(datasets: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> List[str]:
+    """
+    Collect the access URLs and resource URLs checked by the Accessibility indicators.
     
-    if "resources" in metadata and isinstance(metadata["resources"], list):
-        for resource in metadata["resources"]:
-            if isinstance(resource, dict) and "url" in resource:
-                url = resource.get("url", "")
-                if url and url.strip() and url.lower() not in HIDDEN_NULLS:
-                    urls.append(url.lower())
-                    
+    Args:
+        datasets: DataFrame with one dataset per row, read from its "url" and
+            "resources" columns, or an iterable of dataset metadata dictionaries
+            
+    Returns:
+        List of URLs, in dataset order
+    """
+    if isinstance(datasets, pd.DataFrame):
+        url_fields = zip(_column_values(datasets, "url"), _column_values(datasets, "resources"))
+    else:
+        url_fields = ((dataset.get("url"), dataset.get("resources")) for dataset in datasets)
+        
+    urls = []
+    for url, resources in url_fields:
+        if is_present_value(url) and isinstance(url, str):
+            urls.append(url)
+        if is_present_value(resources):
+            urls.extend(parse_resources(resources).urls)
+            
     return urls
 
+class ResourceView:
+    """
+    Read-only view of a dataset's metadata with one resource added under the
+    key "resource". Lookups fall through to the dataset, so no copy is needed.
+    """
+    __slots__ = ("metadata", "resource")
+    
+    def __init__(self, metadata: Dict[str, Any], resource: Any):
+        self.metadata = metadata
+        self.resource = resource
+        
+    def __contains__(self, key: str) -> bool:
+        return key == "resource" or key in self.metadata
+        
+    def __getitem__(self, key: str) -> Any:
+        if key == "resource":
+            return self.resource
+        return self.metadata[key]
+        
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "resource":
+            return self.resource
+        return self.metadata.get(key, default)
+
 def get_best_distribution_score(metadata: Dict[str, Any], 
                                indicator_functions: List[Tuple[str, Callable, int]]) -> int:
     """
     Calculate the maximum score for a single distribution (resource).
     Returns the highest score among all resources for the given indicators.
+    
+    Each check function gets the dataset's metadata with the resource under
+    the key "resource". The built-in distribution indicators only look at the
+    resources of the whole dataset, so calculate_dimension_scores and
+    calculate_mqa_score score them once instead of calling this function.
     """
-    if "resources" not in metadata or not metadata["resources"]:
+    if not has_distributions(metadata):
         return 0
         
     max_score = 0
     
-    for resource in metadata["resources"]:
-        resource_score = 0
-        
-        # Create a resource-specific metadata dictionary
-        resource_metadata = {**metadata, "resource": resource}
-        
-        for name, check_func, points in indicator_functions:
-            if check_func(resource_metadata):
-                resource_score += points
-                
-        max_score = max(max_score, resource_score)
-        
+    # The resources list is the same in every view, so it is parsed once
+    with _parse_resources_once(metadata):
+        for resource in metadata["resources"]:
+            resource_score = 0
+            
+            # Resource-specific view of the metadata
+            resource_metadata = ResourceView(metadata, resource)
+            
+            for name, check_func, points in indicator_functions:
+                if check_func(resource_metadata):
+                    resource_score += points
+                    
+            max_score = max(max_score, resource_score)
+            
     return max_score
 
 # ------------------------------------------------
@@ -267,13 +547,13 @@ INDICATORS_FINDABILITY = [
         "name": "Keywords (Schlagwörter)",
         "field": "dcat:keyword",
         "max_points": 30,
-        "check_func": lambda meta: check_presence(meta, "tags") and isinstance(meta["tags"], list) and len(meta["tags"]) > 0,
+        "check_func": lambda meta: is_non_empty_list(meta.get("tags")),
     },
     {
         "name": "Categories (Kategorien)",
         "field": "dcat:theme",
         "max_points": 30,
-        "check_func": lambda meta: check_presence(meta, "groups") and isinstance(meta["groups"], list) and len(meta["groups"]) > 0,
+        "check_func": lambda meta: is_non_empty_list(meta.get("groups")),
     },
     {
         "name": "Spatial Coverage (Räumliche Abdeckung)",
@@ -302,14 +582,13 @@ INDICATORS_ACCESSIBILITY = [
         "name": "Download URL Presence (Download URL vorhanden)",
         "field": "dcat:downloadURL",
         "max_points": 20,
-        "check_func": lambda meta: check_presence(meta, "resources") and len(extract_resources_urls(meta)) > 0,
+        "check_func": lambda meta: len(get_resource_features(meta).urls) > 0,
     },
     {
         "name": "Download URL Accessibility (Zugänglichkeit der Download URL)",
         "field": "dcat:downloadURL_is_reachable",
         "max_points": 30,
-        "check_func": lambda meta: check_presence(meta, "resources") and 
-                                any(is_url_accessible(url) for url in extract_resources_urls(meta)),
+        "check_func": lambda meta: any_url_accessible(get_resource_features(meta).urls),
     },
 ]
 
@@ -320,44 +599,39 @@ INDICATORS_INTEROPERABILITY = [
         "name": "Format",
         "field": "dct:format",
         "max_points": 20,
-        "check_func": lambda meta: check_presence(meta, "resources") and len(extract_resources_formats(meta)) > 0,
+        "check_func": lambda meta: len(get_resource_features(meta).formats) > 0,
     },
     {
         "name": "Media Type (Medientyp)",
         "field": "dcat:mediaType",
         "max_points": 10,
-        "check_func": lambda meta: check_presence(meta, "resources") and len(extract_resources_mimetypes(meta)) > 0,
+        "check_func": lambda meta: len(get_resource_features(meta).mimetypes) > 0,
     },
     {
         "name": "Format/Media Type from Vocabulary (Format/Medientyp aus Vokabular)",
         "field": "format_media_vocab_check",
         "max_points": 10,
-        "check_func": lambda meta: check_presence(meta, "resources") and 
-                                any(check_format_in_register(fmt) for fmt in extract_resources_formats(meta)) or
-                                any(mime in ACCEPTED_MIME_TYPES for mime in extract_resources_mimetypes(meta)),
+        "check_func": lambda meta: get_resource_features(meta).has_vocab_format or
+                                get_resource_features(meta).has_vocab_mimetype,
     },
     {
         "name": "Non-proprietary (Nicht-proprietär)",
         "field": "non_proprietary_format_check",
         "max_points": 20,
-        "check_func": lambda meta: check_presence(meta, "resources") and 
-                                any(fmt.lower() in NON_PROPRIETARY_FORMATS 
-                                    for fmt in extract_resources_formats(meta)),
+        "check_func": lambda meta: get_resource_features(meta).has_non_proprietary,
     },
     {
         "name": "Machine-readability (Maschinenlesbarkeit)",
         "field": "machine_readable_format_check",
         "max_points": 20,
-        "check_func": lambda meta: check_presence(meta, "resources") and 
-                                any(fmt.lower() in MACHINE_READABLE_FORMATS 
-                                    for fmt in extract_resources_formats(meta)),
+        "check_func": lambda meta: get_resource_features(meta).has_machine_readable,
     },
     {
         "name": "DCAT-AP.de Conformity (DCAT-AP.de Konformität)",
         "field": "dcat_ap_de_conformance",
         "max_points": 30,
-        # Currently automatically granted, as in the Swiss model
-        "check_func": lambda meta: True,
+        # Currently automatically granted to every distribution, as in the Swiss model
+        "check_func": lambda meta: has_distributions(meta),
     },
 ]
 
@@ -375,7 +649,8 @@ INDICATORS_REUSABILITY = [
         "max_points": 10,
         # Check against DCAT-AP.de vocabulary
         "check_func": lambda meta: check_presence(meta, "license_id") and 
-                             meta.get("license_id", "").lower() in [lic.lower() for lic in VALID_DCAT_AP_DE_LICENSES],
+                             isinstance(meta["license_id"], str) and
+                             meta["license_id"].lower() in VALID_LICENSES_LOWER,
     },
     {
         "name": "Access Rights Level (Zugänglichkeitsgrad)",
@@ -420,9 +695,7 @@ INDICATORS_CONTEXT = [
         "name": "Byte Size (Grösse in Bytes)",
         "field": "dcat:byteSize",
         "max_points": 5,
-        "check_func": lambda meta: check_presence(meta, "resources") and 
-                                any(check_presence(resource, "size") 
-                                    for resource in meta["resources"] if isinstance(resource, dict)),
+        "check_func": lambda meta: get_resource_features(meta).has_size,
     },
     {
         "name": "Release Date (Veröffentlichungsdatum)",
@@ -447,71 +720,116 @@ MQA_DIMENSIONS = {
     "Context": INDICATORS_CONTEXT
 }
 
+# The indicator table flattened once at import time into
+# (dimension, max points, distribution-based, ((name, check_func, points), ...))
+# so that scoring does not look up dictionary keys per indicator and dataset
+COMPILED_DIMENSIONS = tuple(
+    (dimension_name, MAX_POINTS_PER_DIMENSION[dimension_name], dimension_name == "Interoperability",
+     tuple((ind["name"], ind["check_func"], ind["max_points"]) for ind in indicators))
+    for dimension_name, indicators in MQA_DIMENSIONS.items()
+)
+
 # ------------------------------------------------
 # 2. Main Scoring Function
 # ------------------------------------------------
 
-def calculate_mqa_score(metadata: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_dimension_scores(metadata: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Calculate only the dimension scores of a dataset, without detailed results.
+    
+    Args:
+        metadata: Dictionary containing dataset metadata fields
+    
+    Returns:
+        Dictionary mapping each dimension to its score
+    """
+    dimension_scores = {}
+    
+    distributions = has_distributions(metadata)
+    
+    # Parse the resources once for all indicators of this dataset
+    with _parse_resources_once(metadata):
+        for dimension_name, max_dim_score, per_distribution, checks in COMPILED_DIMENSIONS:
+            dim_score = 0
+            # The distribution indicators only look at the resources of the whole
+            # dataset, so every distribution scores the same and the best one
+            # equals the dataset level score
+            if not per_distribution or distributions:
+                for _, check_func, points in checks:
+                    if check_func(metadata):
+                        dim_score += points
+                        
+            # Ensure dimension score does not exceed official maximum
+            dimension_scores[dimension_name] = clamp_score(dim_score, max_dim_score)
+        
+    return dimension_scores
+
+def calculate_mqa_score(metadata: Dict[str, Any], detailed: bool = True) -> Dict[str, Any]:
     """
     Calculate Metadata Quality Assessment (MQA) score for a dataset.
     
+    Only the fields listed in SCORING_COLUMNS are read, other fields can be
+    left out of the metadata.
+    
     Args:
         metadata: Dictionary containing dataset metadata fields
+        detailed: Whether to include which indicators passed/failed.
+            Without details the scores are calculated by calculate_dimension_scores.
     
     Returns:
         Dictionary with dimension scores, total score, final rating,
         and detailed information about which indicators passed/failed
+        (empty if detailed is False)
     """
+    if not detailed:
+        dimension_scores = calculate_dimension_scores(metadata)
+        total_score = sum(dimension_scores.values())
+        return {
+            "dimension_scores": dimension_scores,
+            "total_score": total_score,
+            "rating": get_final_rating(total_score),
+            "detailed_results": {}
+        }
+    
     dimension_scores = {}
     total_score = 0
     detailed_results = {}
     
-    # Calculate score for each dimension
-    for dimension_name, indicators in MQA_DIMENSIONS.items():
-        dim_score = 0
-        max_dim_score = MAX_POINTS_PER_DIMENSION[dimension_name]
-        dimension_details = []
-        
-        # Special case for Interoperability which uses distribution-specific logic
-        if dimension_name == "Interoperability":
-            # Convert indicators to format needed by get_best_distribution_score
-            indicator_tuples = [(ind["name"], ind["check_func"], ind["max_points"]) 
-                              for ind in indicators]
-            dim_score = get_best_distribution_score(metadata, indicator_tuples)
+    distributions = has_distributions(metadata)
+    
+    # Parse the resources once for all indicators of this dataset
+    with _parse_resources_once(metadata):
+        # Calculate score for each dimension
+        for dimension_name, max_dim_score, per_distribution, checks in COMPILED_DIMENSIONS:
+            dim_score = 0
+            dimension_details = []
             
-            # Record details for each indicator (simplified for distributions)
-            for ind in indicators:
-                passed = ind["check_func"](metadata)
-                points = ind["max_points"] if passed else 0
-                dimension_details.append({
-                    "indicator": ind["name"],
-                    "field": ind["field"],
-                    "max_points": ind["max_points"],
-                    "points": points,
-                    "passed": passed
-                })
-        else:
-            # Standard dimension scoring
-            for ind in indicators:
-                passed = ind["check_func"](metadata)
-                points = ind["max_points"] if passed else 0
-                dim_score += points
-                
+            for ind, (_, check_func, points) in zip(MQA_DIMENSIONS[dimension_name], checks):
+                passed = check_func(metadata)
+                if passed:
+                    dim_score += points
+                    
                 # Record details for this indicator
                 dimension_details.append({
                     "indicator": ind["name"],
                     "field": ind["field"],
-                    "max_points": ind["max_points"],
-                    "points": points,
+                    "max_points": points,
+                    "points": points if passed else 0,
                     "passed": passed
                 })
+            
+            # Special case for Interoperability which uses distribution-specific logic
+            # (details above are simplified for distributions). The best distribution
+            # scores the same as the dataset, as in calculate_dimension_scores
+            if per_distribution and not distributions:
+                dim_score = 0
+            
+            # Ensure dimension score does not exceed official maximum
+            dim_score = clamp_score(dim_score, max_dim_score)
+            dimension_scores[dimension_name] = dim_score
+            total_score += dim_score
+            detailed_results[dimension_name] = dimension_details
         
-        # Ensure dimension score does not exceed official maximum
-        dim_score = clamp_score(dim_score, max_dim_score)
-        dimension_scores[dimension_name] = dim_score
-        total_score += dim_score
-        detailed_results[dimension_name] = dimension_details
-    
     # Get the final rating category
     rating = get_final_rating(total_score)
     
@@ -532,92 +850,482 @@ def get_final_rating(score: int) -> str:
     Returns:
         Rating category: Excellent, Good, Sufficient, or Poor
     """
-    if 351 <= score <= 405:
-        return "Ausgezeichnet" # Excellent
-    elif 221 <= score <= 350:
-        return "Gut" # Good
-    elif 121 <= score <= 220:
-        return "Ausreichend" # Sufficient
-    else:
-        return "Mangelhaft" # Poor
+    return RATING_LABELS[bisect_right(RATING_BINS, score)]
         
 # ------------------------------------------------
 # 3. Batch Processing Functions
 # ------------------------------------------------
 
-def process_datasets(datasets: List[Dict[str, Any]], 
-                    output_file: Optional[str] = None,
+# Indicator layout for vectorized scoring: one column per indicator in the
+# order of MQA_DIMENSIONS, with its points and the dimension it belongs to
+INDICATOR_FIELDS = [ind["field"] for indicators in MQA_DIMENSIONS.values() for ind in indicators]
+INDICATOR_POINTS = np.array([ind["max_points"] for indicators in MQA_DIMENSIONS.values() 
+                             for ind in indicators])
+INDICATOR_DIMENSIONS = np.array([dimension_name for dimension_name, indicators in MQA_DIMENSIONS.items() 
+                                 for _ in indicators])
+
+# Weight matrix of shape (indicators, dimensions): the points of each
+# indicator in the column of its dimension, zero elsewhere
+DIMENSION_NAMES = list(MQA_DIMENSIONS)
+INDICATOR_WEIGHTS = np.where(INDICATOR_DIMENSIONS[:, None] == np.array(DIMENSION_NAMES)[None, :],
+                             INDICATOR_POINTS[:, None], 0)
+DIMENSION_MAX_POINTS = np.array([MAX_POINTS_PER_DIMENSION[name] for name in DIMENSION_NAMES])
+
+def _column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return the values of a column as an object array (all None if the column is missing)."""
+    if column in df.columns:
+        return df[column].to_numpy(dtype=object)
+    return np.full(len(df), None, dtype=object)
+
+def _evaluate(check: Callable[[Any], bool], values: Iterable[Any], count: int) -> np.ndarray:
+    """Evaluate 'check' for each value and return the results as a boolean array."""
+    return np.fromiter(map(check, values), dtype=bool, count=count)
+
+class ResourceColumns(NamedTuple):
+    """
+    Resources of many datasets flattened into one array per value
+    (structure of arrays). 'rows' holds the dataset index of each resource;
+    missing formats, media types and URLs are None.
+    """
+    rows: np.ndarray
+    formats: np.ndarray
+    mimetypes: np.ndarray
+    urls: np.ndarray
+    has_size: np.ndarray
+
+def flatten_resources(resources: Iterable[Any]) -> ResourceColumns:
+    """Flatten the resources lists of many datasets into ResourceColumns."""
+    rows = []
+    formats = []
+    mimetypes = []
+    urls = []
+    has_size = []
+    
+    for row, value in enumerate(resources):
+        if not isinstance(value, list):
+            continue
+        for resource in value:
+            if not isinstance(resource, dict):
+                continue
+            rows.append(row)
+            formats.append(normalize_resource_value(resource, "format"))
+            mimetypes.append(normalize_resource_value(resource, "mimetype"))
+            urls.append(normalize_resource_value(resource, "url"))
+            has_size.append(check_presence(resource, "size"))
+            
+    return ResourceColumns(np.array(rows, dtype=np.intp),
+                           np.array(formats, dtype=object),
+                           np.array(mimetypes, dtype=object),
+                           np.array(urls, dtype=object),
+                           np.array(has_size, dtype=bool))
+
+def _any_per_dataset(rows: np.ndarray, flags: np.ndarray, n: int) -> np.ndarray:
+    """Reduce per-resource flags to one flag per dataset: True if any of its resources is True."""
+    return np.bincount(rows[flags], minlength=n) > 0
+
+def _check_by_category(codes: np.ndarray, categories: Iterable[str], 
+                       check: Callable[[str], bool]) -> np.ndarray:
+    """
+    Evaluate 'check' once per category and map the results back to all values
+    through their category codes (see pd.factorize). Missing values give False.
+    """
+    lookup = np.fromiter(map(check, categories), dtype=bool, count=len(categories))
+    # The code of missing values is -1, which picks the trailing False
+    return np.append(lookup, False)[codes]
+
+def evaluate_indicators(df: pd.DataFrame, 
+                        url_status: Optional[Dict[str, bool]] = None,
+                        show_progress: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Evaluate all MQA indicators for every dataset in a DataFrame at once.
+    
+    Mirrors the check functions of the indicator tables, but evaluates each
+    indicator for a whole column instead of calling it once per dataset.
+    The resources of all datasets are flattened into one array per value
+    (see flatten_resources), checked as whole arrays and reduced per dataset.
+    
+    Args:
+        df: DataFrame with one dataset per row
+        url_status: Accessibility of the URLs in the DataFrame; checked here if not given
+        show_progress: Whether to show a progress bar for the URL checks
+        
+    Returns:
+        Dictionary mapping each indicator field to a boolean array with one value per row
+    """
+    n = len(df)
+    
+    def present(column: str) -> np.ndarray:
+        return _evaluate(is_present_value, _column_values(df, column), n)
+    
+    resources = _column_values(df, "resources")
+    columns = flatten_resources(resources)
+    
+    # Per-resource checks on the flattened columns. Values only come from
+    # non-empty resources, so no separate check for present resources is needed.
+    resource_has_format = columns.formats != None
+    resource_has_mimetype = columns.mimetypes != None
+    resource_has_url = columns.urls != None
+    # Formats and media types take few distinct values, so they are encoded
+    # as categories and each distinct value is checked only once
+    format_codes, format_categories = pd.factorize(columns.formats)
+    mime_codes, mime_categories = pd.factorize(columns.mimetypes)
+    resource_format_in_vocab = _check_by_category(
+        format_codes, format_categories, check_format_in_register)
+    resource_non_proprietary = _check_by_category(
+        format_codes, format_categories, NON_PROPRIETARY_FORMATS.__contains__)
+    resource_machine_readable = _check_by_category(
+        format_codes, format_categories, MACHINE_READABLE_FORMATS.__contains__)
+    resource_mime_in_vocab = _check_by_category(
+        mime_codes, mime_categories, ACCEPTED_MIME_TYPES_LOWER.__contains__)
+    
+    # Only the best distribution counts for Interoperability, so datasets
+    # without distributions get no points in that dimension
+    has_distributions = _evaluate(is_resource_list, resources, n)
+    
+    access_urls = _column_values(df, "url")
+    if url_status is None:
+        url_status = check_urls_accessible(
+            [url for url in access_urls if isinstance(url, str) and is_present_value(url)] +
+            list(columns.urls[resource_has_url]),
+            show_progress=show_progress)
+    access_url_ok = _evaluate(
+        lambda url: isinstance(url, str) and is_present_value(url) and url_status.get(url, False),
+        access_urls, n)
+    resource_url_ok = _evaluate(lambda url: url_status.get(url, False), columns.urls, len(columns.urls))
+    
+    # Reduce the per-resource checks to one value per dataset
+    rows = columns.rows
+    has_download_url = _any_per_dataset(rows, resource_has_url, n)
+    has_format = _any_per_dataset(rows, resource_has_format, n)
+    has_mimetype = _any_per_dataset(rows, resource_has_mimetype, n)
+    download_url_ok = _any_per_dataset(rows, resource_url_ok, n)
+    format_in_vocab = _any_per_dataset(rows, resource_format_in_vocab, n)
+    mime_in_vocab = _any_per_dataset(rows, resource_mime_in_vocab, n)
+    non_proprietary = _any_per_dataset(rows, resource_non_proprietary, n)
+    machine_readable = _any_per_dataset(rows, resource_machine_readable, n)
+    has_size = _any_per_dataset(rows, columns.has_size, n)
+    
+    license_ids = _column_values(df, "license_id")
+    
+    return {
+        # Findability
+        "dcat:keyword": _evaluate(is_non_empty_list, _column_values(df, "tags"), n),
+        "dcat:theme": _evaluate(is_non_empty_list, _column_values(df, "groups"), n),
+        "dct:spatial": present("geographical_coverage"),
+        "dct:temporal": present("temporal_coverage_from") | present("temporal_coverage_to"),
+        
+        # Accessibility
+        "dcat:accessURL_is_reachable": access_url_ok,
+        "dcat:downloadURL": has_download_url,
+        "dcat:downloadURL_is_reachable": download_url_ok,
+        
+        # Interoperability
+        "dct:format": has_format,
+        "dcat:mediaType": has_mimetype,
+        "format_media_vocab_check": format_in_vocab | mime_in_vocab,
+        "non_proprietary_format_check": non_proprietary,
+        "machine_readable_format_check": machine_readable,
+        "dcat_ap_de_conformance": has_distributions,
+        
+        # Reusability
+        "dct:license": present("license_id"),
+        "license_vocab_check": present("license_id") & _evaluate(
+            lambda lic: isinstance(lic, str) and lic.lower() in VALID_LICENSES_LOWER, license_ids, n),
+        "dct:accessRights": np.ones(n, dtype=bool),
+        "access_rights_vocab_check": np.ones(n, dtype=bool),
+        "dcat:contactPoint": present("maintainer") | present("maintainer_email"),
+        "dct:publisher": present("author") | present("organization.title"),
+        
+        # Context
+        "dct:rights": present("license_title"),
+        "dcat:byteSize": has_size,
+        "dct:issued": present("date_released"),
+        "dct:modified": present("date_updated"),
+    }
+
+def mqa_kernel(passed: np.ndarray) -> np.ndarray:
+    """
+    Calculate the dimension scores from the indicator results.
+    
+    Args:
+        passed: Boolean matrix of shape (datasets, indicators) in INDICATOR_FIELDS order
+        
+    Returns:
+        Integer matrix of shape (datasets, dimensions) in DIMENSION_NAMES order,
+        clamped to the official maximum of each dimension
+    """
+    return np.minimum(passed @ INDICATOR_WEIGHTS, DIMENSION_MAX_POINTS)
+
+def score_dataframe(df: pd.DataFrame, 
+                    url_status: Optional[Dict[str, bool]] = None,
                     show_progress: bool = True) -> pd.DataFrame:
     """
+    Calculate MQA scores for all datasets in a DataFrame at once.
+    
+    Produces the same scores as calculate_mqa_score, but evaluates every
+    indicator as a boolean column and computes the dimension scores with
+    matrix operations instead of looping over the datasets.
+    
+    Args:
+        df: DataFrame with one dataset per row
+        url_status: Accessibility of the URLs in the DataFrame; checked here if not given
+        show_progress: Whether to show a progress bar for the URL checks
+        
+    Returns:
+        DataFrame with MQA results for all datasets
+    """
+    # Skip datasets that don't have crucial metadata
+    keep = (_evaluate(bool, _column_values(df, "title"), len(df)) & 
+            _evaluate(bool, _column_values(df, "id"), len(df)))
+    df = df[keep]
+    
+    # Boolean matrix of shape (datasets, indicators)
+    checks = evaluate_indicators(df, url_status=url_status, show_progress=show_progress)
+    passed = np.column_stack([checks[field] for field in INDICATOR_FIELDS])
+    
+    scores = mqa_kernel(passed)
+    total_scores = scores.sum(axis=1)
+    
+    ratings = RATING_LABELS_ARRAY[np.digitize(total_scores, RATING_BINS)]
+    
+    result_df = pd.DataFrame({
+        "id": _column_values(df, "id"),
+        "title": _column_values(df, "title"),
+        "organization": [org.get("title", "") if isinstance(org, dict) else "" 
+                         for org in _column_values(df, "organization")],
+        "total_score": total_scores,
+        "rating": ratings,
+    })
+    
+    # Add dimension scores
+    for i, dimension in enumerate(DIMENSION_NAMES):
+        result_df[f"{dimension}_score"] = scores[:, i]
+        
+    return result_df
+
+def get_process_context() -> multiprocessing.context.BaseContext:
+    """
+    Return the multiprocessing context used to score in worker processes.
+    
+    forkserver is preferred where available: it starts the workers without
+    forking a parent that has running threads (URL checks) and open sockets
+    (HTTP sessions).
+    """
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    return multiprocessing.get_context(start_method)
+
+def _score_chunk(datasets: Union[pd.DataFrame, List[Dict[str, Any]]], 
+                 url_status: Dict[str, bool]) -> pd.DataFrame:
+    """Score a chunk of datasets in a worker process, using URL checks made by the parent."""
+    if not isinstance(datasets, pd.DataFrame):
+        datasets = pd.DataFrame(datasets)
+    return score_dataframe(datasets, url_status=url_status, show_progress=False)
+
+def iter_chunks(datasets: Union[pd.DataFrame, Iterable[Dict[str, Any]]], 
+                chunk_size: int) -> Iterator[Union[pd.DataFrame, List[Dict[str, Any]]]]:
+    """
+    Split datasets into chunks of at most chunk_size datasets: row slices
+    of a DataFrame, or lists of dictionaries from any other iterable.
+    """
+    if isinstance(datasets, pd.DataFrame):
+        for start in range(0, len(datasets), chunk_size):
+            yield datasets.iloc[start:start + chunk_size]
+        return
+        
+    iterator = iter(datasets)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def process_datasets(datasets: Union[pd.DataFrame, Iterable[Dict[str, Any]]], 
+                    output_file: Optional[str] = None,
+                    show_progress: bool = True,
+                    workers: int = 1,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> pd.DataFrame:
+    """
     Process multiple datasets, calculating MQA score for each one.
     
+    A DataFrame is scored directly in row slices. Other iterables are
+    consumed in chunks, so they can be streamed from a generator
+    (see iter_datasets_from_file) without holding all of them in memory.
+    
     Args:
-        datasets: List of dataset metadata dictionaries
+        datasets: DataFrame with one dataset per row, or an iterable of
+            dataset metadata dictionaries
         output_file: Optional path to save results as CSV
         show_progress: Whether to show a progress bar
+        workers: Number of processes to score with. The URLs are checked
+            up front in this process, so the workers do no network I/O.
+        chunk_size: Maximum number of datasets scored at once
         
     Returns:
         DataFrame with MQA results for all datasets
     """
-    results = []
-    
-    # Use tqdm for progress tracking if requested
-    iterator = tqdm(datasets, desc="Processing datasets") if show_progress else datasets
-    
-    for dataset in iterator:
-        # Skip datasets that don't have crucial metadata
-        if not dataset.get("title") or not dataset.get("id"):
-            continue
+    if workers > 1:
+        # Spread datasets of known size evenly over the workers
+        if hasattr(datasets, "__len__"):
+            chunk_size = max(1, min(chunk_size, len(datasets) // (4 * workers)))
             
-        try:
-            # Calculate MQA score
-            mqa_result = calculate_mqa_score(dataset)
-            
-            # Create a row with dataset info and scores
-            result_row = {
-                "id": dataset.get("id", ""),
-                "title": dataset.get("title", ""),
-                "organization": dataset.get("organization", {}).get("title", "") 
-                               if isinstance(dataset.get("organization"), dict) else "",
-                "total_score": mqa_result["total_score"],
-                "rating": mqa_result["rating"],
-            }
-            
-            # Add dimension scores
-            for dimension, score in mqa_result["dimension_scores"].items():
-                result_row[f"{dimension}_score"] = score
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_process_context()) as executor:
+            futures = []
+            for chunk in iter_chunks(datasets, chunk_size):
+                url_status = check_urls_accessible(collect_urls(chunk), show_progress=show_progress)
+                futures.append(executor.submit(_score_chunk, chunk, url_status))
                 
-            results.append(result_row)
-        except Exception as e:
-            print(f"Error processing dataset {dataset.get('id', 'unknown')}: {e}")
-    
-    # Create DataFrame from results
-    result_df = pd.DataFrame(results)
+            if show_progress:
+                futures = tqdm(futures, desc="Processing datasets", mininterval=0.5)
+            frames = [future.result() for future in futures]
+    elif isinstance(datasets, pd.DataFrame):
+        frames = [score_dataframe(chunk, show_progress=show_progress) 
+                  for chunk in iter_chunks(datasets, chunk_size)]
+    else:
+        frames = [score_dataframe(pd.DataFrame(chunk), show_progress=show_progress) 
+                  for chunk in iter_chunks(datasets, chunk_size)]
+        
+    if frames:
+        result_df = pd.concat(frames, ignore_index=True)
+    else:
+        result_df = score_dataframe(pd.DataFrame(), show_progress=False)
     
     # Save to CSV if requested
     if output_file:
-        result_df.to_csv(output_file, index=False)
+        save_results_csv(result_df, output_file)
         
     return result_df
 
-def load_datasets_from_file(file_path: str) -> List[Dict[str, Any]]:
+def save_results_csv(result_df: pd.DataFrame, output_file: str) -> None:
     """
-    Load datasets from a JSON or CSV file.
+    Save MQA results as CSV using Arrow's multithreaded CSV writer.
+    Unlike DataFrame.to_csv, Arrow quotes the header names and all text values.
+    
+    Args:
+        result_df: DataFrame with MQA results
+        output_file: Path of the CSV file
+    """
+    # Arrow needs one type per column, so object columns with mixed values
+    # (e.g. numeric and text ids) are written as text, keeping missing values
+    object_columns = result_df.select_dtypes(include="object").columns
+    if len(object_columns) > 0:
+        result_df = result_df.astype({column: "string" for column in object_columns})
+        
+    table = pa.Table.from_pandas(result_df, preserve_index=False)
+    pa_csv.write_csv(table, output_file, write_options=pa_csv.WriteOptions(quoting_style="needed"))
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+def _iter_json_array(f: TextIO, block_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Decode the items of a JSON array one by one while reading the file in
+    blocks, so the whole array is never held in memory at once.
+    
+    Args:
+        f: Text file containing a JSON array
+        block_size: Number of characters read at a time
+        
+    Returns:
+        Iterator over the items of the array
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    
+    def read_more() -> None:
+        """Append the next block to the buffer, dropping what was already decoded."""
+        nonlocal buffer, pos, eof
+        block = f.read(block_size)
+        buffer = buffer[pos:] + block
+        pos = 0
+        eof = not block
+        
+    def next_char() -> str:
+        """Skip whitespace and return the next character ('' at the end of the file)."""
+        nonlocal pos
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            read_more()
+            
+    if next_char() != "[":
+        raise ValueError("Expected a JSON array of datasets")
+    pos += 1
+    if next_char() == "]":
+        return
+        
+    while True:
+        next_char()
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The item may continue in the next block
+            if eof:
+                raise
+            read_more()
+            continue
+        if end == len(buffer) and not eof:
+            # A value at the end of the buffer (e.g. a number) may be cut off
+            read_more()
+            continue
+            
+        yield item
+        pos = end
+        
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
+        pos += 1
+
+def iter_datasets_from_file(file_path: str, 
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Stream datasets from a JSON or CSV file.
+    
+    The file is read incrementally: a JSON array item by item, a CSV file
+    chunk_size rows at a time. The file format is checked right away, the
+    file itself is only opened once iteration starts.
     
     Args:
         file_path: Path to the file
+        chunk_size: Number of CSV rows read at a time
         
     Returns:
-        List of dataset metadata dictionaries
+        Iterator over dataset metadata dictionaries
+        
+    Raises:
+        ValueError: If the file format is not supported
     """
     if file_path.endswith('.json'):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        def read_datasets() -> Iterator[Dict[str, Any]]:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                yield from _iter_json_array(f)
     elif file_path.endswith('.csv'):
-        df = pd.read_csv(file_path)
-        return df.to_dict('records')
+        def read_datasets() -> Iterator[Dict[str, Any]]:
+            for chunk in pd.read_csv(file_path, chunksize=chunk_size):
+                yield from chunk.to_dict('records')
     else:
         raise ValueError(f"Unsupported file format: {file_path}")
+        
+    return read_datasets()
+
+def load_datasets_from_file(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Load datasets from a JSON or CSV file.
+    
+    Use iter_datasets_from_file to process large files without loading
+    all datasets at once.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        List of dataset metadata dictionaries
+    """
+    return list(iter_datasets_from_file(file_path))
 
 # ------------------------------------------------
 # 4. Example Usage
@@ -634,23 +1342,23 @@ def main():
         return
         
     print(f"Loading datasets from {data_path}...")
-    datasets = []
     
-    # Read CSV file
-    df = pd.read_csv(data_path)
+    # Read CSV file, keeping only the columns needed for scoring
+    df = pd.read_csv(data_path, 
+                     usecols=lambda col: col in SCORING_COLUMNS,
+                     dtype={col: "category" for col in CATEGORICAL_COLUMNS})
     
     # Process string columns that might contain JSON
     for col in ['resources', 'tags', 'groups', 'extras']:
         if col in df.columns:
-            df[col] = df[col].apply(lambda x: 
-                                   json.loads(x) if isinstance(x, str) else x)
+            df[col] = [orjson.loads(x) if isinstance(x, str) else x for x in df[col].to_numpy()]
     
-    datasets = df.to_dict('records')
-    print(f"Loaded {len(datasets)} datasets.")
+    print(f"Loaded {len(df)} datasets.")
     
-    # Calculate MQA scores
+    # Calculate MQA scores directly on the DataFrame
     output_path = "_results/mqa_scores.csv"
-    results = process_datasets(datasets, output_file=output_path)
+    results = score_dataframe(df)
+    save_results_csv(results, output_path)
     
     # Print summary
     print("\nMetadata Quality Assessment Results:")
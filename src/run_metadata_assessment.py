@@ -13,91 +13,252 @@ This script:
 
 import os
 import sys
-import json
+import ast
+import time
+import shutil
 import argparse
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Iterator
 from tqdm import tqdm
 
 # Add parent directory to path to import local modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
-    from src.metadata_quality_assessment import process_datasets, calculate_mqa_score
+    from src.metadata_quality_assessment import (
+        process_datasets, calculate_mqa_score, check_urls_accessible, collect_urls, iter_chunks,
+        preload_url_status, get_process_context, save_results_csv, SCORING_COLUMNS
+    )
 except ImportError:
-    from metadata_quality_assessment import process_datasets, calculate_mqa_score
+    from metadata_quality_assessment import (
+        process_datasets, calculate_mqa_score, check_urls_accessible, collect_urls, iter_chunks,
+        preload_url_status, get_process_context, save_results_csv, SCORING_COLUMNS
+    )
 
 # Constants
 BERLIN_API_URL = "https://datenregister.berlin.de/api/3/action/current_package_list_with_resources"
 DEFAULT_DATA_DIR = "data"
 DEFAULT_RESULTS_DIR = "results"
+DEFAULT_FETCH_CONCURRENCY = 8
+DEFAULT_RECORDS_CHUNK_SIZE = 1000
+API_TIMEOUT = 30
+
+def _create_api_session(pool_size: int) -> requests.Session:
+    """
+    Create an HTTP session for the API that keeps connections alive between
+    pages and retries transient gateway errors with backoff.
+    
+    Args:
+        pool_size: Number of connections kept open, i.e. concurrent requests
+        
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _fetch_page(session: requests.Session, limit: int, offset: int) -> List[Dict[str, Any]]:
+    """
+    Fetch a single page of dataset metadata from the API.
+    
+    Args:
+        session: HTTP session to send the request with
+        limit: Number of records to fetch
+        offset: Index of the first record
+        
+    Returns:
+        List of dataset records (empty when the API has no more records)
+    """
+    url = f"{BERLIN_API_URL}?limit={limit}&offset={offset}"
+    res = session.get(url, timeout=API_TIMEOUT)
+    data = orjson.loads(res.content)
+    return data.get("result") or []
+
+def _to_text(value: Any) -> Optional[str]:
+    """Convert a value to text for storage, nested values (e.g. resources) as JSON."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def _flatten_record(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dictionaries into dotted keys, as pandas.json_normalize does."""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_record(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+def _page_to_table(page: List[Dict[str, Any]]) -> pa.Table:
+    """
+    Convert a page of API records to an Arrow table for the raw Parquet file.
+    
+    Nested dictionaries become dotted columns as with pandas.json_normalize.
+    Every value is stored as text, nested values (e.g. resources) as JSON
+    that prepare_data parses again, so a field whose type differs between
+    pages (e.g. "many" after a number) converts like any other.
+    
+    Args:
+        page: Dataset records of one API page
+        
+    Returns:
+        Arrow table of the page with one string column per field
+    """
+    rows = [_flatten_record(record) for record in page]
+    columns = dict.fromkeys(name for row in rows for name in row)
+    return pa.table({
+        name: pa.array([_to_text(row.get(name)) for row in rows], type=pa.string())
+        for name in columns
+    })
+
+def _combine_page_files(page_files: List[str], output_file: str) -> None:
+    """
+    Combine the Parquet files of the fetched pages into one file that has the
+    columns of all pages, including fields that only appear on later pages.
+    
+    Args:
+        page_files: Files written by _page_to_table, in offset order
+        output_file: Path of the combined Parquet file
+    """
+    schema = pa.unify_schemas([pq.read_schema(page_file) for page_file in page_files])
+    
+    # ZSTD keeps the file small without slowing down reads
+    with pq.ParquetWriter(output_file, schema, compression='zstd') as writer:
+        for page_file in page_files:
+            table = pq.read_table(page_file)
+            for field in schema:
+                if field.name not in table.column_names:
+                    table = table.append_column(field, pa.nulls(table.num_rows, field.type))
+            writer.write_table(table.select(schema.names))
 
 def fetch_metadata(
         limit: int = 500, 
         sleep: int = 2, 
-        output_file: Optional[str] = None
+        output_file: Optional[str] = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        legacy_csv: bool = False
     ) -> pd.DataFrame:
     """
     Fetch metadata from Berlin Open Data API
     
+    Pages are requested in waves of `concurrency` concurrent requests, since
+    the API does not report the total number of records up front. When saving
+    to Parquet, each page is written to its own file as soon as it arrives
+    instead of keeping all records in memory, and the pages are combined
+    into the raw file once all of them are fetched.
+    
     Args:
         limit: Number of records to fetch per request
-        sleep: Delay between requests in seconds
+        sleep: Delay between request waves in seconds
         output_file: Optional path to save the raw metadata
+        concurrency: Number of pages requested at the same time
+        legacy_csv: Save the raw metadata as CSV instead of Parquet
         
     Returns:
         DataFrame containing metadata for all datasets
     """
-    import time
-    
     print(f"Fetching metadata from Berlin Open Data API: {BERLIN_API_URL}")
     
+    if output_file:
+        # Create directory if needed
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        
+        # Ensure the output file has the extension of the chosen format
+        extension = '.csv' if legacy_csv else '.parquet'
+        if not output_file.endswith(extension):
+            output_file = os.path.splitext(output_file)[0] + extension
+    
+    stream_to_parquet = bool(output_file) and not legacy_csv
+    # The raw file is written under a temporary name and renamed when complete,
+    # so a failed fetch never leaves a truncated file that looks like the latest data
+    partial_file = f"{output_file}.part" if output_file else None
+    page_dir = f"{output_file}.pages" if stream_to_parquet else None
+    page_files = []
     offset = 0
-    frames = []
+    records = []
+    total_records = 0
+    finished = False
     
-    while True:
-        url = f"{BERLIN_API_URL}?limit={limit}&offset={offset}"
-        print(f"Fetching records {offset} to {offset+limit}...")
-        
-        try:
-            res = requests.get(url)
-            data = res.json()
+    try:
+        if page_dir:
+            os.makedirs(page_dir, exist_ok=True)
             
-            if "result" not in data or not data["result"]:
-                break
+        with ThreadPoolExecutor(max_workers=concurrency) as executor, \
+                _create_api_session(concurrency) as session:
+            while not finished:
+                offsets = [offset + i * limit for i in range(concurrency)]
+                print(f"Fetching records {offsets[0]} to {offsets[-1]+limit}...")
+                futures = [executor.submit(_fetch_page, session, limit, o) for o in offsets]
                 
-            # Convert to DataFrame
-            df = pd.json_normalize(data["result"])
-            frames.append(df)
-            
-            # Increment offset for next batch
-            offset += limit
-            time.sleep(sleep)
-            
-        except Exception as e:
-            print(f"Error fetching data: {e}")
-            break
+                # Keep pages in offset order and stop at the first empty or failed one
+                for future in futures:
+                    try:
+                        page = future.result()
+                    except Exception as e:
+                        print(f"Error fetching data: {e}")
+                        finished = True
+                        break
+                    
+                    if not page:
+                        finished = True
+                        break
+                    
+                    if stream_to_parquet:
+                        page_file = os.path.join(page_dir, f"page_{len(page_files):06d}.parquet")
+                        pq.write_table(_page_to_table(page), page_file)
+                        page_files.append(page_file)
+                    else:
+                        records.extend(page)
+                    total_records += len(page)
+                
+                # Increment offset for next wave
+                offset += concurrency * limit
+                if not finished:
+                    time.sleep(sleep)
+                    
+        if page_files:
+            _combine_page_files(page_files, partial_file)
+            os.replace(partial_file, output_file)
+    finally:
+        if page_dir:
+            shutil.rmtree(page_dir, ignore_errors=True)
+        if partial_file and os.path.exists(partial_file):
+            os.remove(partial_file)
     
-    if not frames:
+    if not total_records:
         raise ValueError("No data retrieved from API")
+    print(f"Retrieved {total_records} datasets from API")
+    
+    if stream_to_parquet:
+        print(f"Raw metadata saved to {output_file}")
+        return pd.read_parquet(output_file)
         
-    # Combine all batches
-    data = pd.concat(frames)
-    print(f"Retrieved {len(data)} datasets from API")
+    # Convert all batches to a DataFrame at once
+    data = pd.json_normalize(records)
     
     # Save raw data if requested
     if output_file:
-        # Create directory if needed
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        # Ensure the output file has .parquet extension
-        if not output_file.endswith('.parquet'):
-            output_file = output_file.replace('.csv', '.parquet') if output_file.endswith('.csv') else output_file + '.parquet'
-            
-        # Save in Parquet format
-        data.to_parquet(output_file, index=False)
+        data.to_csv(partial_file, index=False)
+        os.replace(partial_file, output_file)
         print(f"Raw metadata saved to {output_file}")
     
     return data
@@ -129,15 +290,14 @@ def prepare_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with cleaned metadata
     """
-    import ast
-    
     # Convert string representations of JSON to Python objects
     for col in ['resources', 'tags', 'groups', 'extras']:
         if col in df.columns:
-            # Try both json.loads and ast.literal_eval for robustness
-            df[col] = df[col].apply(
-                lambda x: _safe_parse_json(x) if isinstance(x, str) else x
-            )
+            # Try both json and ast.literal_eval for robustness, missing values are skipped
+            df[col] = df[col].map(_safe_parse_json, na_action='ignore')
+    
+    # Parsed values are shared between rows now, the cache itself is no longer needed
+    _parse_json_cached.cache_clear()
     
     # Ensure all expected columns exist
     for col in ['organization']:
@@ -146,31 +306,117 @@ def prepare_data(df: pd.DataFrame) -> pd.DataFrame:
             
     return df
 
-def _safe_parse_json(json_string: str) -> Any:
+def _safe_parse_json(json_string: Any) -> Any:
     """
     Safely parse a JSON string using multiple methods.
     
+    Arrays, which list columns become when read from Parquet, are turned
+    back into lists. Other values that are not strings (e.g. already parsed
+    lists) are returned as they are.
+    
     Args:
         json_string: String containing JSON or Python literal
         
     Returns:
         Parsed Python object
     """
+    if isinstance(json_string, np.ndarray):
+        return json_string.tolist()
+    
     if not isinstance(json_string, str) or not json_string.strip():
         return json_string
+    
+    return _parse_json_cached(json_string)
+
+@lru_cache(maxsize=None)
+def _parse_json_cached(json_string: str) -> Any:
+    """
+    Parse a JSON string once per distinct value (e.g. repeated tag lists or "[]").
+    
+    The returned objects are shared between all cells with the same string,
+    so they must be treated as read-only.
+    
+    Args:
+        json_string: String containing JSON or Python literal
         
-    # Try json.loads first
+    Returns:
+        Parsed Python object, or the original string if parsing fails
+    """
+    # Try orjson first
     try:
-        return json.loads(json_string)
-    except:
+        return orjson.loads(json_string)
+    except orjson.JSONDecodeError:
         # Fall back to ast.literal_eval
         try:
-            import ast
             return ast.literal_eval(json_string)
-        except:
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
             # Return original if all parsing fails
             return json_string
 
+def _score_one(item: Tuple[int, Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """
+    Calculate the MQA score of one dataset, possibly in a worker process.
+    
+    Args:
+        item: Position of the dataset and its metadata. Detailed results are
+            only collected for the first few datasets, which get printed.
+        
+    Returns:
+        Tuple of the MQA result and None, or None and the raised exception
+    """
+    i, dataset = item
+    try:
+        return calculate_mqa_score(dataset, detailed=i < 3), None
+    except Exception as e:
+        return None, e
+
+def _score_records(df: pd.DataFrame, executor: Optional[ProcessPoolExecutor] = None
+                   ) -> Iterator[Tuple[Dict[str, Any], Tuple[Optional[Dict[str, Any]], Optional[Exception]]]]:
+    """
+    Score the rows of a DataFrame one by one and yield each dataset with its result.
+    
+    Rows are converted to dictionaries once, in chunks, so the whole DataFrame
+    is never held as a list of dictionaries. The datasets stay in this process
+    and are paired with their results here, only the scoring runs in the
+    worker processes of the executor if one is given.
+    
+    Args:
+        df: DataFrame with one dataset per row
+        executor: Optional process pool to score in
+        
+    Returns:
+        Iterator of (dataset, (result, exception)) in row order, see _score_one
+    """
+    start = 0
+    for chunk in iter_chunks(df, DEFAULT_RECORDS_CHUNK_SIZE):
+        records = chunk.to_dict('records')
+        items = enumerate(records, start)
+        if executor is not None:
+            scored = executor.map(_score_one, items, chunksize=64)
+        else:
+            scored = map(_score_one, items)
+        yield from zip(records, scored)
+        start += len(records)
+
+def _link_latest(path: str, link_path: str) -> None:
+    """
+    Point link_path at path with a relative symlink, so that the generic
+    file name always refers to the latest results.
+    
+    Falls back to copying the file where symlinks are not available
+    (e.g. on Windows without the required privilege).
+    
+    Args:
+        path: File written by this run
+        link_path: Generic file name to update
+    """
+    if os.path.lexists(link_path):
+        os.unlink(link_path)
+    try:
+        os.symlink(os.path.relpath(path, os.path.dirname(link_path)), link_path)
+    except (OSError, NotImplementedError):
+        shutil.copyfile(path, link_path)
+
 def main():
     """Run the metadata quality assessment process."""
     # Parse command line arguments
@@ -206,19 +452,31 @@ def main():
         '--sample', '-s', type=int, default=0,
         help='Process only a sample of datasets (0 for all)'
     )
+    parser.add_argument(
+        '--legacy-csv', action='store_true',
+        help='Save fetched raw metadata as CSV instead of Parquet'
+    )
+    parser.add_argument(
+        '--workers', '-w', type=int, default=1,
+        help='Number of processes used to calculate the scores (default: 1)'
+    )
     
     args = parser.parse_args()
     
+    # One timestamp for all files written by this run
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_date = run_timestamp.split("_")[0]
+    
     # Create necessary directories
     os.makedirs(args.data_dir, exist_ok=True)
     os.makedirs(args.results_dir, exist_ok=True)
     
     # Determine data source and load data
+    raw_extension = '.csv' if args.legacy_csv else '.parquet'
     if args.fetch:
         # Fetch from API
-        timestamp = datetime.now().strftime("%Y%m%d")
-        raw_data_path = os.path.join(args.data_dir, f"berlin_metadata_{timestamp}.parquet")
-        df = fetch_metadata(output_file=raw_data_path)
+        raw_data_path = os.path.join(args.data_dir, f"berlin_metadata_{run_date}{raw_extension}")
+        df = fetch_metadata(output_file=raw_data_path, legacy_csv=args.legacy_csv)
         
     elif args.input:
         # Load from specified file
@@ -227,26 +485,32 @@ def main():
         
     else:
         # Try to find existing data files (prioritize parquet files)
-        data_files = [f for f in os.listdir(args.data_dir) if f.endswith('.parquet')]
+        with os.scandir(args.data_dir) as entries:
+            candidates = [entry for entry in entries 
+                          if entry.is_file() and entry.name.endswith(('.parquet', '.csv'))]
+        data_files = [entry for entry in candidates if entry.name.endswith('.parquet')]
         if not data_files:
-            data_files = [f for f in os.listdir(args.data_dir) if f.endswith('.csv')]
+            data_files = candidates
         
         if data_files:
-            # Use the latest file by name or modification time
-            latest_file = sorted(data_files)[-1]
-            input_path = os.path.join(args.data_dir, latest_file)
+            # Use the most recently modified file
+            latest_file = max(data_files, key=lambda entry: entry.stat().st_mtime)
+            input_path = latest_file.path
             print(f"No input specified, using most recent file: {input_path}")
             df = load_data(input_path)
         else:
             # Fetch new data if no existing files
             print("No existing data files found, fetching from API...")
-            timestamp = datetime.now().strftime("%Y%m%d")
-            raw_data_path = os.path.join(args.data_dir, f"berlin_metadata_{timestamp}.csv")
-            df = fetch_metadata(output_file=raw_data_path)
+            raw_data_path = os.path.join(args.data_dir, f"berlin_metadata_{run_date}{raw_extension}")
+            df = fetch_metadata(output_file=raw_data_path, legacy_csv=args.legacy_csv)
     
     # Display basic info
     print(f"Loaded {len(df)} datasets.")
     
+    # Keep only the columns used for scoring, so the other fields are
+    # neither parsed nor copied into every dataset dictionary
+    df = df[[col for col in SCORING_COLUMNS if col in df.columns]]
+    
     # Prepare data for processing
     df = prepare_data(df)
     print("Data preparation complete.")
@@ -256,133 +520,159 @@ def main():
         print(f"Processing a sample of {args.sample} datasets")
         df = df.sample(args.sample)
     
-    # Convert DataFrame to list of dictionaries for processing
-    datasets = df.to_dict('records')
+    # Detailed result of the first dataset, kept when it is scored in detail anyway
+    first_result = None
     
     if args.verbose:
         # Process with detailed logging
         results = []
-        total_datasets = len(datasets)
+        total_datasets = len(df)
         
         # Counters for statistics
         successful = 0
         errors = 0
-        ratings_count = {"Ausgezeichnet": 0, "Gut": 0, "Ausreichend": 0, "Mangelhaft": 0}
+        ratings_count = Counter()
+        
+        # Check all URLs up front in parallel instead of one by one while scoring
+        print("Checking URL accessibility...")
+        url_status = check_urls_accessible(collect_urls(df))
+        
+        # Score in worker processes if requested, results arrive in dataset order
+        executor = None
+        if args.workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=args.workers, mp_context=get_process_context(),
+                initializer=preload_url_status, initargs=(url_status,)
+            )
         
         # Process each dataset with detailed logging
-        for i, dataset in enumerate(tqdm(datasets, desc="Processing datasets")):
-            # Print progress periodically or for the first few
-            if i < 10 or i % 100 == 0 or i == total_datasets - 1:
-                print(f"Processing dataset {i+1}/{total_datasets}: {dataset.get('title', 'Unknown')}")
-            
-            try:
-                # Log details for the first few datasets
-                if i < 5:
-                    print(f"  Checking dimensions for: {dataset.get('id', 'unknown')}")
-                    print(f"  Resources: {len(dataset.get('resources', []))} found")
-                    print(f"  Tags: {len(dataset.get('tags', []))} found")
+        # Limit progress bar refreshes, which are noticeable next to fast scoring
+        progress = tqdm(_score_records(df, executor), total=total_datasets, desc="Processing datasets", 
+                        mininterval=0.5, miniters=max(1, total_datasets // 200))
+        try:
+            for i, (dataset, (result, error)) in enumerate(progress):
+                # Log lines of this dataset, written at once below the progress bar
+                lines = []
                 
-                # Calculate the MQA score
-                result = calculate_mqa_score(dataset)
-                successful += 1
+                # Print progress periodically or for the first few
+                if i < 10 or i % 100 == 0 or i == total_datasets - 1:
+                    lines.append(f"Processing dataset {i+1}/{total_datasets}: {dataset.get('title', 'Unknown')}")
                 
-                # Update ratings counter
-                if result['rating'] in ratings_count:
+                try:
+                    # Log details for the first few datasets
+                    if i < 5:
+                        lines.append(f"  Checking dimensions for: {dataset.get('id', 'unknown')}")
+                        lines.append(f"  Resources: {len(dataset.get('resources', []))} found")
+                        lines.append(f"  Tags: {len(dataset.get('tags', []))} found")
+                    
+                    # Scoring errors from the worker are handled like local ones
+                    if error is not None:
+                        raise error
+                    successful += 1
+                    
+                    if i == 0:
+                        first_result = result
+                    
+                    # Update ratings counter
                     ratings_count[result['rating']] += 1
-                
-                # Create a results dictionary
-                result_summary = {
-                    'id': dataset.get('id', 'unknown'),
-                    'title': dataset.get('title', 'Unknown'),
-                    'organization': dataset.get('organization', {}).get('title', 'Unknown') 
-                                  if isinstance(dataset.get('organization'), dict) else 'Unknown',
-                    'total_score': result['total_score'],
-                    'rating': result['rating'],
-                }
-                
-                # Add dimension scores
-                for dimension, score in result['dimension_scores'].items():
-                    result_summary[f"{dimension}_score"] = score
                     
-                results.append(result_summary)
-                
-                # Print detailed results for the first few datasets
-                if i < 3:
-                    print(f"  Total Score: {result['total_score']}")
-                    print(f"  Rating: {result['rating']}")
-                    print("  Dimension Scores:")
-                    for dim, score in result['dimension_scores'].items():
-                        print(f"    {dim}: {score}")
+                    # Create a results dictionary
+                    result_summary = {
+                        'id': dataset.get('id', 'unknown'),
+                        'title': dataset.get('title', 'Unknown'),
+                        'organization': dataset.get('organization', {}).get('title', 'Unknown') 
+                                      if isinstance(dataset.get('organization'), dict) else 'Unknown',
+                        'total_score': result['total_score'],
+                        'rating': result['rating'],
+                    }
                     
-                    # Print sample indicator results
-                    print("  Sample Indicators:")
-                    for dimension, indicators in result['detailed_results'].items():
-                        for ind in indicators[:2]:  # Print first 2 indicators per dimension
-                            print(f"    {dimension} - {ind['indicator']}: {ind['points']}/{ind['max_points']} (Passed: {ind['passed']})")
-                    print()
+                    # Add dimension scores
+                    for dimension, score in result['dimension_scores'].items():
+                        result_summary[f"{dimension}_score"] = score
+                        
+                    results.append(result_summary)
                     
-                # Print progress summary periodically
-                if (i + 1) % 500 == 0:
-                    print(f"\nProgress Update ({i+1}/{total_datasets}):")
-                    print(f"  Successful: {successful}")
-                    print(f"  Errors: {errors}")
-                    print(f"  Ratings so far: {ratings_count}")
-                    print()
+                    # Print detailed results for the first few datasets
+                    if i < 3:
+                        lines.append(f"  Total Score: {result['total_score']}")
+                        lines.append(f"  Rating: {result['rating']}")
+                        lines.append("  Dimension Scores:")
+                        for dim, score in result['dimension_scores'].items():
+                            lines.append(f"    {dim}: {score}")
+                        
+                        # Print sample indicator results
+                        lines.append("  Sample Indicators:")
+                        for dimension, indicators in result['detailed_results'].items():
+                            for ind in indicators[:2]:  # Print first 2 indicators per dimension
+                                lines.append(f"    {dimension} - {ind['indicator']}: {ind['points']}/{ind['max_points']} (Passed: {ind['passed']})")
+                        lines.append("")
+                        
+                    # Print progress summary periodically
+                    if (i + 1) % 500 == 0:
+                        lines.append(f"\nProgress Update ({i+1}/{total_datasets}):")
+                        lines.append(f"  Successful: {successful}")
+                        lines.append(f"  Errors: {errors}")
+                        lines.append(f"  Ratings so far: {dict(ratings_count)}")
+                        lines.append("")
+                        
+                except Exception as e:
+                    errors += 1
+                    lines.append(f"  Error processing dataset {dataset.get('id', 'unknown')}: {e}")
                     
-            except Exception as e:
-                errors += 1
-                print(f"  Error processing dataset {dataset.get('id', 'unknown')}: {e}")
+                    # Print details about the problematic dataset
+                    lines.append(f"  Problem dataset info:")
+                    for key in ['id', 'title', 'resources', 'tags']:
+                        lines.append(f"    {key}: {dataset.get(key, 'Not found')}")
                 
-                # Print details about the problematic dataset
-                print(f"  Problem dataset info:")
-                for key in ['id', 'title', 'resources', 'tags']:
-                    print(f"    {key}: {dataset.get(key, 'Not found')}")
+                # Write through tqdm, so the log does not break the progress bar
+                if lines:
+                    tqdm.write("\n".join(lines))
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
         # Convert results to DataFrame
         results_df = pd.DataFrame(results)
         
     else:
         # Use standard processing function
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(args.results_dir, f"mqa_scores_{timestamp}.csv")
-        print(f"Calculating metadata quality scores for {len(datasets)} datasets...")
+        print(f"Calculating metadata quality scores for {len(df)} datasets...")
         
-        # Process datasets
-        results_df = process_datasets(datasets, output_file=output_path)
-    
-    # Save results with timestamp and generic name
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Score the DataFrame directly, without converting rows to dictionaries
+        results_df = process_datasets(df, workers=args.workers)
     
     # Define output paths
     if args.sample > 0 and args.sample < 20:
         # Sample run
-        output_path = os.path.join(args.results_dir, f"mqa_sample_scores_{timestamp}.csv")
+        output_path = os.path.join(args.results_dir, f"mqa_sample_scores_{run_timestamp}.csv")
         generic_output_path = os.path.join(args.results_dir, "mqa_sample_scores.csv")
     else:
         # Full run
-        output_path = os.path.join(args.results_dir, f"mqa_scores_{timestamp}.csv")
+        output_path = os.path.join(args.results_dir, f"mqa_scores_{run_timestamp}.csv")
         generic_output_path = os.path.join(args.results_dir, "mqa_scores.csv")
     
-    # Save to both timestamped and generic files
-    results_df.to_csv(output_path, index=False)
-    results_df.to_csv(generic_output_path, index=False)
+    # Save the timestamped file once and point the generic name at it
+    save_results_csv(results_df, output_path)
+    _link_latest(output_path, generic_output_path)
     
     # Also save ratings summary
-    ratings_summary = pd.DataFrame(results_df['rating'].value_counts())
-    ratings_summary.index.name = 'rating'
-    ratings_summary.to_csv(os.path.join(args.results_dir, "ratings_summary.csv"))
+    rating_counts = results_df['rating'].value_counts()
+    rating_counts.rename_axis('rating').to_frame('count').to_csv(
+        os.path.join(args.results_dir, "ratings_summary.csv")
+    )
     
     # Save detailed results for the first dataset as JSON
-    if len(datasets) > 0:
-        first_result = calculate_mqa_score(datasets[0])
-        with open(os.path.join(args.results_dir, "detailed_first_dataset.json"), "w") as f:
-            json.dump(first_result, f, indent=2)
+    if first_result is None and len(df) > 0:
+        first_result = calculate_mqa_score(df.iloc[:1].to_dict('records')[0])
+    if first_result is not None:
+        with open(os.path.join(args.results_dir, "detailed_first_dataset.json"), "wb") as f:
+            f.write(orjson.dumps(first_result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     # Print summary
     print("\nMetadata Quality Assessment Results:")
     print(f"Average score: {results_df['total_score'].mean():.2f}")
     print("\nRating distribution:")
-    print(results_df['rating'].value_counts())
+    print(rating_counts)
     
     print(f"\nResults saved to {args.results_dir}")
 
@@ -0,0 +1,128 @@
+"""
+Checks that the batch scoring (score_dataframe / evaluate_indicators) and the
+per-dataset scoring (calculate_mqa_score / MQA_DIMENSIONS) agree.
+
+The indicator rules are written twice, once as check functions and once as
+column operations, so both are evaluated on the same fuzzed records and
+compared indicator by indicator.
+"""
+
+import os
+import random
+import sys
+import unittest
+from typing import Dict, Any, List
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import metadata_quality_assessment as mqa
+
+FORMATS = ["CSV", "json", "WFS", "EXCEL", "pdf", "xlsx", "", "none", "Shapefile", "html", "geojson", None, 5]
+MIME_TYPES = ["text/csv", "application/json", "", "application/octet-stream", "TEXT/CSV", None, "n/a"]
+TEXT_VALUES = ["", "none", "Berlin", "2020-01-01", "keine angabe", "  ", "N/A", "x", None,
+               float("nan"), [], [""], ["Berlin"], {}, 0]
+URLS = ["http://ok.example/a", "http://bad.example/b", "", "none", None, ["http://ok.example/a"]]
+LICENSES = ["dl-de-by-2.0", "CC-BY", "other", "", "cc by 3.0 de", None, float("nan")]
+TEXT_FIELDS = [
+    "geographical_coverage", "temporal_coverage_from", "temporal_coverage_to", "license_title",
+    "maintainer", "maintainer_email", "author", "date_released", "date_updated", "organization.title",
+]
+
+
+def fake_check_url(url: str) -> bool:
+    """Stand-in for the HTTP check: only URLs on ok.example are accessible."""
+    return "ok.example" in url
+
+
+def fuzzed_records(count: int, seed: int) -> List[Dict[str, Any]]:
+    """Create dataset records with missing, empty, hidden-null and oddly typed values."""
+    rng = random.Random(seed)
+    records = []
+
+    for i in range(count):
+        record = {"id": f"id{i}", "title": f"Title {i}"}
+
+        if rng.random() > 0.2:
+            record["tags"] = rng.choice([[{"name": "a"}] * rng.randint(0, 3), [""], "tag", None])
+        if rng.random() > 0.3:
+            record["groups"] = [{"name": "g"}] * rng.randint(0, 2)
+        for field in TEXT_FIELDS:
+            if rng.random() > 0.3:
+                record[field] = rng.choice(TEXT_VALUES)
+        if rng.random() > 0.2:
+            record["url"] = rng.choice(URLS)
+        if rng.random() > 0.2:
+            record["license_id"] = rng.choice(LICENSES)
+        if rng.random() > 0.5:
+            record["organization"] = rng.choice([{"title": "Org"}, {}, "Org"])
+
+        if rng.random() > 0.2:
+            resources = []
+            for _ in range(rng.randint(0, 4)):
+                resource = {}
+                if rng.random() > 0.2:
+                    resource["format"] = rng.choice(FORMATS)
+                if rng.random() > 0.3:
+                    resource["mimetype"] = rng.choice(MIME_TYPES)
+                if rng.random() > 0.2:
+                    resource["url"] = rng.choice(URLS[:5])
+                if rng.random() > 0.5:
+                    resource["size"] = rng.choice([None, 12, "", "100"])
+                resources.append(resource if rng.random() > 0.05 else "not a resource")
+            record["resources"] = rng.choice([resources, resources, resources, None, "[]"])
+
+        records.append(record)
+
+    return records
+
+
+class ScoringParityTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(mqa, "_check_url", fake_check_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_paths_agree(self, df: pd.DataFrame) -> None:
+        records = df.to_dict("records")
+
+        checks = mqa.evaluate_indicators(df)
+        batch_passed = np.column_stack([checks[field] for field in mqa.INDICATOR_FIELDS])
+        batch_scores = mqa.mqa_kernel(batch_passed)
+
+        for row, record in enumerate(records):
+            result = mqa.calculate_mqa_score(record)
+
+            passed = [bool(ind["passed"]) for dimension in mqa.DIMENSION_NAMES
+                      for ind in result["detailed_results"][dimension]]
+            scores = [result["dimension_scores"][dimension] for dimension in mqa.DIMENSION_NAMES]
+
+            with self.subTest(row=row, id=record.get("id")):
+                self.assertEqual(dict(zip(mqa.INDICATOR_FIELDS, passed)),
+                                 dict(zip(mqa.INDICATOR_FIELDS, batch_passed[row].tolist())))
+                self.assertEqual(dict(zip(mqa.DIMENSION_NAMES, scores)),
+                                 dict(zip(mqa.DIMENSION_NAMES, batch_scores[row].tolist())))
+
+    def test_fuzzed_records(self):
+        # Keys missing from a record become NaN in the DataFrame
+        for seed in range(3):
+            self.assert_paths_agree(pd.DataFrame(fuzzed_records(500, seed)))
+
+    def test_fuzzed_records_without_nan(self):
+        df = pd.DataFrame(fuzzed_records(500, seed=10)).astype(object)
+        self.assert_paths_agree(df.where(df.notna(), None))
+
+    def test_total_scores(self):
+        df = pd.DataFrame(fuzzed_records(300, seed=20))
+        result_df = mqa.score_dataframe(df, show_progress=False)
+        expected = [mqa.calculate_mqa_score(record)["total_score"] for record in df.to_dict("records")]
+        self.assertEqual(result_df["total_score"].tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()